@@ -4,7 +4,7 @@ from typing import Any
 
 from azure.core.credentials import TokenCredential
 
-from shared import get_entra_conninfo
+from shared import get_entra_conninfo, get_entra_password
 from errors import (
     CredentialValueError,
     EntraConnectionValueError,
@@ -53,20 +53,20 @@ class EntraConnection(connection):
         has_user = "user" in dsn_params or "user" in kwargs
         has_password = "password" in dsn_params or "password" in kwargs
 
-        # Only get Entra credentials if user or password is missing
-        if not has_user or not has_password:
-            try:
+        # Only get Entra credentials if user or password is missing. The token only
+        # has to be decoded when the username must be discovered from its claims.
+        try:
+            if not has_user:
                 entra_creds = get_entra_conninfo(credential)
-            except (Exception) as e:
-                raise EntraConnectionValueError(
-                    "Could not retrieve Entra credentials"
-                ) from e
-
-            # Only update missing credentials
-            if not has_user and "user" in entra_creds:
                 dsn_params["user"] = entra_creds["user"]
-            if not has_password and "password" in entra_creds:
-                dsn_params["password"] = entra_creds["password"]
+                if not has_password:
+                    dsn_params["password"] = entra_creds["password"]
+            elif not has_password:
+                dsn_params["password"] = get_entra_password(credential)
+        except Exception as e:
+            raise EntraConnectionValueError(
+                "Could not retrieve Entra credentials"
+            ) from e
 
         # Update DSN params with any kwargs (kwargs take precedence)
         dsn_params.update(kwargs)
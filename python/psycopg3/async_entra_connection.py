@@ -2,17 +2,19 @@
 
 from typing import Any
 
+from azure.core.credentials import TokenCredential
 from azure.core.credentials_async import AsyncTokenCredential
 
 try:
     from psycopg import AsyncConnection
+    from psycopg.conninfo import conninfo_to_dict
 except ImportError as e:
     raise ImportError(
         "psycopg3 dependencies are not installed. "
         "Install them with: pip install azurepg-entra[psycopg3]"
     ) from e
 
-from shared import get_entra_conninfo_async
+from shared import get_entra_conninfo_async, get_entra_password_async
 from errors import (
     CredentialValueError,
     EntraConnectionValueError,
@@ -33,7 +35,8 @@ class AsyncEntraConnection(AsyncConnection):
         Parameters:
             *args: Positional arguments to be forwarded to the parent connection method.
             **kwargs: Keyword arguments including:
-                - credential (AsyncTokenCredential, optional): Async Azure credential for token acquisition.
+                - credential (AsyncTokenCredential or TokenCredential, optional): Azure credential for
+                  token acquisition. Sync credentials are called in a worker thread.
                 - user (str, optional): Database username. If not provided, extracted from Entra token.
                 - password (str, optional): Database password. If not provided, uses Entra access token.
 
@@ -41,26 +44,36 @@ class AsyncEntraConnection(AsyncConnection):
             AsyncEntraConnection: An open asynchronous connection to the PostgreSQL database.
 
         Raises:
-            CredentialValueError: If the provided credential is not a valid AsyncTokenCredential.
+            CredentialValueError: If the provided credential is not a valid AsyncTokenCredential or TokenCredential.
             EntraConnectionValueError: If Entra connection credentials are invalid.
         """
         credential = kwargs.pop("credential", None)
-        if credential and not isinstance(credential, (AsyncTokenCredential)):
+        if credential and not isinstance(
+            credential, (AsyncTokenCredential, TokenCredential)
+        ):
             raise CredentialValueError(
-                "credential must be an AsyncTokenCredential for async connections"
+                "credential must be an AsyncTokenCredential or TokenCredential for async connections"
             )
 
-        # Check if we need to acquire Entra authentication info
-        if not kwargs.get("user") or not kwargs.get("password"):
-            try:
+        # Check if user and password are already provided, either as keyword
+        # arguments or in the conninfo string the pool passes positionally
+        conninfo = args[0] if args else kwargs.get("conninfo", "")
+        conninfo_params = conninfo_to_dict(conninfo) if conninfo else {}
+        has_user = bool(kwargs.get("user") or conninfo_params.get("user"))
+        has_password = bool(kwargs.get("password") or conninfo_params.get("password"))
+
+        # Acquire Entra authentication info if needed. The token only has to be
+        # decoded when the username must be discovered from its claims.
+        try:
+            if not has_user:
                 entra_conninfo = await get_entra_conninfo_async(credential)
-            except Exception as e:
-                raise EntraConnectionValueError(
-                    "Could not retrieve Entra credentials"
-                ) from e
-            # Always use the token password when Entra authentication is needed
-            kwargs["password"] = entra_conninfo["password"]
-            if not kwargs.get("user"):
-                # If user isn't already set, use the username from the token
+                # Always use the token password when Entra authentication is needed
                 kwargs["user"] = entra_conninfo["user"]
+                kwargs["password"] = entra_conninfo["password"]
+            elif not has_password:
+                kwargs["password"] = await get_entra_password_async(credential)
+        except Exception as e:
+            raise EntraConnectionValueError(
+                "Could not retrieve Entra credentials"
+            ) from e
         return await super().connect(*args, **kwargs)
@@ -6,13 +6,14 @@ from azure.core.credentials import TokenCredential
 
 try:
     from psycopg import Connection
+    from psycopg.conninfo import conninfo_to_dict
 except ImportError as e:
     raise ImportError(
         "psycopg3 dependencies are not installed. "
         "Install them with: pip install azurepg-entra[psycopg3]"
     ) from e
 
-from shared import get_entra_conninfo
+from shared import get_entra_conninfo, get_entra_password
 from errors import (
     CredentialValueError,
     EntraConnectionValueError,
@@ -50,17 +51,25 @@ class EntraConnection(Connection):
                 "credential must be a TokenCredential for sync connections"
             )
 
-        # Check if we need to acquire Entra authentication info
-        if not kwargs.get("user") or not kwargs.get("password"):
-            try:
+        # Check if user and password are already provided, either as keyword
+        # arguments or in the conninfo string the pool passes positionally
+        conninfo = args[0] if args else kwargs.get("conninfo", "")
+        conninfo_params = conninfo_to_dict(conninfo) if conninfo else {}
+        has_user = bool(kwargs.get("user") or conninfo_params.get("user"))
+        has_password = bool(kwargs.get("password") or conninfo_params.get("password"))
+
+        # Acquire Entra authentication info if needed. The token only has to be
+        # decoded when the username must be discovered from its claims.
+        try:
+            if not has_user:
                 entra_conninfo = get_entra_conninfo(credential)
-            except Exception as e:
-                raise EntraConnectionValueError(
-                    "Could not retrieve Entra credentials"
-                ) from e
-            # Always use the token password when Entra authentication is needed
-            kwargs["password"] = entra_conninfo["password"]
-            if not kwargs.get("user"):
-                # If user isn't already set, use the username from the token
+                # Always use the token password when Entra authentication is needed
                 kwargs["user"] = entra_conninfo["user"]
+                kwargs["password"] = entra_conninfo["password"]
+            elif not has_password:
+                kwargs["password"] = get_entra_password(credential)
+        except Exception as e:
+            raise EntraConnectionValueError(
+                "Could not retrieve Entra credentials"
+            ) from e
         return super().connect(*args, **kwargs)
@@ -18,6 +18,9 @@ load_dotenv()
 hostname = os.getenv("HOSTNAME")
 database = os.getenv("DATABASE", "postgres")
 
+# Shared asynchronous connection pool, created on first use by get_async_pool().
+_async_pool: AsyncConnectionPool[AsyncEntraConnection] | None = None
+
 
 def main_sync() -> None:
     """Synchronous connection example using psycopg with Entra ID authentication."""
@@ -39,27 +42,50 @@ def main_sync() -> None:
         result = cur.fetchone()
         print(f"Sync - Database time: {result}")
 
+
+async def get_async_pool() -> AsyncConnectionPool[AsyncEntraConnection]:
+    """Returns the shared asynchronous connection pool, opening it on first use.
+
+    The pool is created once and reused, so repeated callers share its open connections
+    instead of each paying for new connections and Entra token requests.
+    """
+    global _async_pool
+    if _async_pool is None:
+        # We use the AsyncEntraConnection class to enable asynchronous Entra-based authentication for database access.
+        # This class is applied whenever the connection pool creates a new connection, ensuring that Entra
+        # authentication tokens are properly managed and refreshed so that each connection uses a valid token.
+        #
+        # For more details, see: https://www.psycopg.org/psycopg3/docs/api/connections.html#psycopg.Connection.connect
+        pool = AsyncConnectionPool(
+            conninfo=f"postgresql://{hostname}:5432/{database}",
+            min_size=1,
+            max_size=5,
+            open=False,
+            connection_class=AsyncEntraConnection,
+        )
+        await pool.open(wait=True)
+        _async_pool = pool
+    return _async_pool
+
+
 async def main_async() -> None:
     """Asynchronous connection example using psycopg with Entra ID authentication."""
 
-    # We use the AsyncEntraConnection class to enable asynchronous Entra-based authentication for database access.
-    # This class is applied whenever the connection pool creates a new connection, ensuring that Entra
-    # authentication tokens are properly managed and refreshed so that each connection uses a valid token.
-    #
-    # For more details, see: https://www.psycopg.org/psycopg3/docs/api/connections.html#psycopg.Connection.connect
-    pool = AsyncConnectionPool(
-        conninfo=f"postgresql://{hostname}:5432/{database}",
-        min_size=1,
-        max_size=5,
-        open=False,
-        connection_class=AsyncEntraConnection,
-    )
-    async with pool, pool.connection() as conn, conn.cursor() as cur:
+    pool = await get_async_pool()
+    async with pool.connection() as conn, conn.cursor() as cur:
         await cur.execute("SELECT now()")
         result = await cur.fetchone()
         print(f"Async - Database time: {result}")
 
 
+async def close_async_pool() -> None:
+    """Closes the shared asynchronous connection pool so the next get_async_pool() opens a new one."""
+    global _async_pool
+    if _async_pool is not None:
+        pool, _async_pool = _async_pool, None
+        await pool.close()
+
+
 async def main(mode: str = "async") -> None:
     """Main function that runs sync and/or async examples based on mode.
 
@@ -84,6 +110,8 @@ async def main(mode: str = "async") -> None:
             print("Async example completed successfully!")
         except Exception as e:
             print(f"Async example failed: {e}")
+        finally:
+            await close_async_pool()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,19 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import base64
+import asyncio
+import atexit
+import contextlib
 import json
-from typing import Any, cast
-
-from azure.core.credentials import TokenCredential
+import logging
+import re
+import threading
+import time
+import weakref
+from binascii import a2b_base64
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar, cast
+
+from azure.core.credentials import AccessToken, AccessTokenInfo, TokenCredential
 from azure.core.credentials_async import AsyncTokenCredential
 from azure.core.exceptions import ClientAuthenticationError
 from azure.identity import CredentialUnavailableError
@@ -17,9 +26,119 @@ from errors import (
     UsernameExtractionError,
 )
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 AZURE_DB_FOR_POSTGRES_SCOPE = "https://ossrdbms-aad.database.windows.net/.default"
 AZURE_MANAGEMENT_SCOPE = "https://management.azure.com/.default"
 
+# Cached tokens are reused until they are this many seconds away from expiry, or until
+# the refresh time reported by the credential, whichever comes first.
+TOKEN_REFRESH_MARGIN = 300
+
+# Padding needed to complete a base64 segment, indexed by its length modulo 4.
+_BASE64_PADDING = (b"", b"===", b"==", b"=")
+# Maps the base64url alphabet onto the standard one understood by a2b_base64.
+_URLSAFE_TRANSLATION = bytes.maketrans(b"-_", b"+/")
+
+# Matches the principal name at the end of a user-assigned managed identity xms_mirid.
+_MANAGED_IDENTITY_PRINCIPAL_RE = re.compile(
+    r"providers/Microsoft\.ManagedIdentity/userAssignedIdentities/([^/]+)\Z",
+    re.IGNORECASE,
+)
+
+# Claims that can carry the database username, and a scanner for their plain string values.
+_USERNAME_CLAIMS = tuple(
+    (name, f'"{name}"'.encode())
+    for name in ("xms_mirid", "upn", "preferred_username", "unique_name")
+)
+_USERNAME_CLAIM_RE = re.compile(
+    rb'"(xms_mirid|upn|preferred_username|unique_name)"\s*:\s*"([^"\\]*)"'
+)
+
+# Process-wide credentials used when callers don't supply one.
+_DEFAULT_CREDENTIAL: DefaultAzureCredential | None = None
+_DEFAULT_ASYNC_CREDENTIAL: AsyncDefaultAzureCredential | None = None
+_DEFAULT_CREDENTIAL_LOCK = threading.Lock()
+
+# Cached tokens per credential, stored as {scope: (token, refresh_at, expires_on)}. Tokens
+# are kept as str: psycopg and psycopg2 build the conninfo string with str() on each
+# value, so a bytes password would reach libpq as "b'...'" rather than the token itself.
+#
+# The token and username caches hold their credentials weakly, so a credential that is
+# created per connection is dropped together with its entries once it is released.
+_TOKEN_CACHE: weakref.WeakKeyDictionary[Any, dict[str, tuple[str, int, int]]] = (
+    weakref.WeakKeyDictionary()
+)
+# The username derived from a credential's claims never changes, so it is resolved once.
+# Token claims are therefore decoded once per credential rather than once per connect.
+_USERNAME_CACHE: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+_TOKEN_CACHE_LOCK = threading.Lock()
+# Async token requests in flight, keyed by (credential, scope), so that concurrent
+# callers such as a pool opening its initial connections share a single request.
+_INFLIGHT_TOKEN_REQUESTS: dict[tuple[Any, str], asyncio.Task[Any]] = {}
+
+# Pending background refreshes for async tokens, stored as {scope: handle} per credential.
+_REFRESH_HANDLES: weakref.WeakKeyDictionary[Any, dict[str, asyncio.TimerHandle]] = (
+    weakref.WeakKeyDictionary()
+)
+# Scopes of async cache entries read since they were stored. Only these are refreshed,
+# so a credential that is kept alive but no longer used stops being refreshed.
+_TOKEN_CACHE_READS: weakref.WeakKeyDictionary[Any, set[str]] = (
+    weakref.WeakKeyDictionary()
+)
+# Running refresh tasks; the event loop only keeps weak references to tasks.
+_REFRESH_TASKS: set[asyncio.Task[None]] = set()
+# Lower bound on the refresh delay, so a credential that keeps returning the same
+# soon-to-expire token is not polled in a tight loop.
+_MIN_TOKEN_REFRESH_DELAY = 30
+
+
+def get_default_azure_credentials() -> DefaultAzureCredential:
+    """Returns the process-wide DefaultAzureCredential used when no credential is given.
+
+    Once created, the credential is returned with a plain global read; the lock is only
+    taken while the first caller creates it.
+
+    Returns:
+        DefaultAzureCredential: A credential shared by all connections in the process.
+    """
+    global _DEFAULT_CREDENTIAL
+    credential = _DEFAULT_CREDENTIAL
+    if credential is None:
+        with _DEFAULT_CREDENTIAL_LOCK:
+            credential = _DEFAULT_CREDENTIAL
+            if credential is None:
+                _DEFAULT_CREDENTIAL = credential = DefaultAzureCredential()
+    return credential
+
+
+def get_default_azure_credentials_async() -> AsyncDefaultAzureCredential:
+    """Returns the process-wide async DefaultAzureCredential used when no credential is given.
+
+    The credential stays open for the lifetime of the process so its HTTP session is
+    reused across token requests, and is closed once at interpreter shutdown.
+
+    Returns:
+        AsyncDefaultAzureCredential: An async credential shared by all connections in the process.
+    """
+    global _DEFAULT_ASYNC_CREDENTIAL
+    credential = _DEFAULT_ASYNC_CREDENTIAL
+    if credential is None:
+        with _DEFAULT_CREDENTIAL_LOCK:
+            credential = _DEFAULT_ASYNC_CREDENTIAL
+            if credential is None:
+                _DEFAULT_ASYNC_CREDENTIAL = credential = AsyncDefaultAzureCredential()
+                atexit.register(_close_async_credential, credential)
+    return credential
+
+
+def _close_async_credential(credential: AsyncTokenCredential) -> None:
+    """Closes an async credential at interpreter shutdown, ignoring any errors."""
+    with contextlib.suppress(Exception):
+        asyncio.run(credential.close())
+
 
 def get_entra_token(credential: TokenCredential | None, scope: str) -> str:
     """Acquires an Entra authentication token for Azure PostgreSQL synchronously.
@@ -32,7 +151,8 @@ def get_entra_token(credential: TokenCredential | None, scope: str) -> str:
     Returns:
         str: The acquired authentication token to be used as the database password.
     """
-    credential = credential or DefaultAzureCredential()
+    credential = credential or get_default_azure_credentials()
+    logger.info("Acquiring Entra token for scope %s", scope)
     cred = credential.get_token(scope)
     return cred.token
 
@@ -50,10 +170,30 @@ async def get_entra_token_async(
     Returns:
         str: The acquired authentication token to be used as the database password.
     """
-    credential = credential or AsyncDefaultAzureCredential()
-    async with credential:
-        cred = await credential.get_token(scope)
-        return cred.token
+    credential = credential or get_default_azure_credentials_async()
+    logger.info("Acquiring Entra token for scope %s", scope)
+    cred = await credential.get_token(scope)
+    return cred.token
+
+
+def _decode_jwt_payload(token: str) -> bytes:
+    """Base64url-decodes the payload segment of a JWT token.
+
+    Raises:
+        TokenDecodeError: If the token format is invalid or cannot be decoded.
+    """
+    try:
+        # Locate the payload between the first two dots so the signature is never copied
+        header_end = token.find(".")
+        payload_end = token.find(".", header_end + 1)
+        if header_end == -1 or payload_end == -1:
+            raise ValueError("JWT token must have three parts")
+        payload = token[header_end + 1 : payload_end].encode("ascii").translate(
+            _URLSAFE_TRANSLATION
+        )
+        return a2b_base64(payload + _BASE64_PADDING[len(payload) & 3])
+    except Exception as e:
+        raise TokenDecodeError("Invalid JWT token format") from e
 
 
 def decode_jwt(token: str) -> dict[str, Any]:
@@ -68,15 +208,63 @@ def decode_jwt(token: str) -> dict[str, Any]:
     Raises:
         TokenValueError: If the token format is invalid or cannot be decoded.
     """
+    decoded_payload = _decode_jwt_payload(token)
     try:
-        payload = token.split(".")[1]
-        padding = "=" * (4 - len(payload) % 4)
-        decoded_payload = base64.urlsafe_b64decode(payload + padding)
         return cast(dict[str, Any], json.loads(decoded_payload))
     except Exception as e:
         raise TokenDecodeError("Invalid JWT token format") from e
 
 
+def decode_jwt_username_claims(token: str) -> dict[str, Any]:
+    """Decodes only the claims of a JWT token that can carry the database username.
+
+    Entra tokens can carry large group and role claims, so a flat payload is scanned for
+    the username claims directly. The payload is fully parsed instead when it contains
+    nested objects, when a claim value contains escapes, or when no claim was found.
+
+    Parameters:
+        token (str): The JWT token string in the standard three-part format.
+
+    Returns:
+        dict[str, Any]: The username claims present in the token payload. The result may
+            also contain other claims when the full payload had to be parsed.
+
+    Raises:
+        TokenDecodeError: If the token format is invalid or cannot be decoded.
+    """
+    decoded_payload = _decode_jwt_payload(token)
+
+    # Only a JSON object without nested objects can be scanned safely, since keys in
+    # nested objects would otherwise be mistaken for top-level claims
+    if (
+        decoded_payload[:1] == b"{"
+        and decoded_payload[-1:] == b"}"
+        and decoded_payload.find(b"{", 1) == -1
+    ):
+        try:
+            claims = {
+                name.decode(): value.decode()
+                for name, value in _USERNAME_CLAIM_RE.findall(decoded_payload)
+            }
+        except UnicodeDecodeError as e:
+            raise TokenDecodeError("Invalid JWT token format") from e
+        # Any claim that is present but could not be scanned, e.g. because its value
+        # contains escapes, needs the full parse below
+        if claims and not any(
+            name not in claims and quoted in decoded_payload
+            for name, quoted in _USERNAME_CLAIMS
+        ):
+            return claims
+
+    try:
+        claims = json.loads(decoded_payload)
+    except Exception as e:
+        raise TokenDecodeError("Invalid JWT token format") from e
+    if not isinstance(claims, dict):
+        raise TokenDecodeError("Invalid JWT token format")
+    return claims
+
+
 def parse_principal_name(xms_mirid: str) -> str | None:
     """Parses the principal name from an Azure resource path.
 
@@ -91,101 +279,353 @@ def parse_principal_name(xms_mirid: str) -> str | None:
 
     # Parse the xms_mirid claim which looks like
     # /subscriptions/{subId}/resourcegroups/{resourceGroup}/providers/Microsoft.ManagedIdentity/userAssignedIdentities/{principalName}
-    last_slash_index = xms_mirid.rfind("/")
-    if last_slash_index == -1:
+    match = _MANAGED_IDENTITY_PRINCIPAL_RE.search(xms_mirid)
+    if not match:
         return None
 
-    beginning = xms_mirid[:last_slash_index]
-    principal_name = xms_mirid[last_slash_index + 1 :]
+    return match.group(1)
+
+
+def _get_username_from_claims(claims: dict[str, Any]) -> str | None:
+    """Extracts the database username from decoded token claims.
+
+    Parameters:
+        claims (dict[str, Any]): The decoded JWT payload claims.
+
+    Returns:
+        str | None: The username, or None if no suitable claim is present.
+    """
+    xms_mirid = claims.get("xms_mirid")
+    return (
+        parse_principal_name(xms_mirid)
+        if isinstance(xms_mirid, str)
+        else None
+        or claims.get("upn")
+        or claims.get("preferred_username")
+        or claims.get("unique_name")
+    )
+
+
+def _get_cached_token(credential: TokenCredential, scope: str) -> str:
+    """Returns a cached token for the scope, acquiring a new one when it is close to expiry.
+
+    Must be called with _TOKEN_CACHE_LOCK held.
+    """
+    cached = _TOKEN_CACHE.get(credential, {}).get(scope)
+    if cached is not None and time.time() < cached[1]:
+        logger.debug("Using cached Entra token for scope %s", scope)
+        return cached[0]
+
+    logger.info("Acquiring Entra token for scope %s", scope)
+    access_token = _request_token(credential, scope)
+    _TOKEN_CACHE.setdefault(credential, {})[scope] = (
+        access_token.token,
+        _get_refresh_time(access_token),
+        access_token.expires_on,
+    )
+    return access_token.token
+
+
+def _get_refresh_time(access_token: AccessToken | AccessTokenInfo) -> int:
+    """Returns the time after which a cached token should be replaced.
+
+    Expiry comes from the credential rather than the JWT's exp claim. Credentials that
+    support get_token_info may also report an earlier refresh_on time, such as managed
+    identity tokens which should be refreshed halfway through their lifetime.
+    """
+    refresh_at = access_token.expires_on - TOKEN_REFRESH_MARGIN
+    refresh_on = getattr(access_token, "refresh_on", None)
+    if refresh_on:
+        refresh_at = min(refresh_at, refresh_on)
+    return refresh_at
+
 
-    if not principal_name or not beginning.lower().endswith(
-        "providers/microsoft.managedidentity/userassignedidentities"
+def _request_token(credential: TokenCredential, scope: str) -> AccessToken | AccessTokenInfo:
+    """Requests a token, using get_token_info when the credential supports it."""
+    if hasattr(credential, "get_token_info"):
+        return credential.get_token_info(scope)
+    return credential.get_token(scope)
+
+
+async def _acquire_token_async(
+    credential: TokenCredential | AsyncTokenCredential, scope: str
+) -> AccessToken | AccessTokenInfo:
+    """Acquires a token from an async or sync credential, using get_token_info when supported.
+
+    Sync credentials are called in a worker thread so that a slow credential, such as one
+    that shells out to the Azure CLI, doesn't block the event loop.
+    """
+    if isinstance(credential, AsyncTokenCredential):
+        if hasattr(credential, "get_token_info"):
+            return await credential.get_token_info(scope)
+        return await credential.get_token(scope)
+    return await asyncio.to_thread(_request_token, credential, scope)
+
+
+async def _run_coalesced(
+    key: tuple[Any, str], request: Callable[[], Coroutine[Any, Any, T]]
+) -> T:
+    """Runs a token request, or joins the one already in flight for the same key.
+
+    The request runs as its own task and callers await it through asyncio.shield, so a
+    caller being cancelled doesn't cancel the request other callers are waiting on.
+    """
+    future: asyncio.Task[T] | None = _INFLIGHT_TOKEN_REQUESTS.get(key)
+    # A finished entry can be left behind if its event loop stopped before the cleanup
+    # callback ran; it must not be reused
+    if future is None or future.done():
+        future = asyncio.get_running_loop().create_task(request())
+        _INFLIGHT_TOKEN_REQUESTS[key] = future
+
+        def cleanup(done: asyncio.Task[T]) -> None:
+            if _INFLIGHT_TOKEN_REQUESTS.get(key) is done:
+                del _INFLIGHT_TOKEN_REQUESTS[key]
+            # Mark the exception as retrieved in case every waiter was cancelled
+            if not done.cancelled():
+                done.exception()
+
+        future.add_done_callback(cleanup)
+    return await asyncio.shield(future)
+
+
+async def _get_cached_token_async(
+    credential: TokenCredential | AsyncTokenCredential, scope: str
+) -> str:
+    """Returns a cached token for the scope, acquiring a new one when it is close to expiry.
+
+    While a background refresh is in flight the cached token is still returned as long as
+    it hasn't expired, so connects don't wait on the refresh.
+    """
+    cached = _TOKEN_CACHE.get(credential, {}).get(scope)
+    now = time.time()
+    if cached is not None and (
+        now < cached[1]
+        or (now < cached[2] and (credential, scope) in _INFLIGHT_TOKEN_REQUESTS)
     ):
-        return None
+        logger.debug("Using cached Entra token for scope %s", scope)
+        _TOKEN_CACHE_READS.setdefault(credential, set()).add(scope)
+        return cached[0]
 
-    return principal_name
+    return await _fetch_token_async(credential, scope)
 
 
-def get_entra_conninfo(credential: TokenCredential | None) -> dict[str, str]:
-    """Synchronously obtains connection information from Entra authentication for Azure PostgreSQL.
+async def _fetch_token_async(
+    credential: TokenCredential | AsyncTokenCredential, scope: str
+) -> str:
+    """Acquires a new token for the scope, caches it and schedules its background refresh.
 
-    This function acquires an access token from Azure Entra ID and extracts the username
-    from the token claims. It tries multiple claim sources to determine the username.
+    Concurrent calls for the same credential and scope share a single token request.
+    """
+    return await _run_coalesced(
+        (credential, scope), lambda: _request_token_async(credential, scope)
+    )
 
-    Parameters:
-        credential (TokenCredential or None): The credential used for token acquisition.
-            If None, DefaultAzureCredential() is used to automatically discover credentials.
 
-    Returns:
-        dict[str, str]: A dictionary with 'user' and 'password' keys, where:
-            - 'user': The extracted username from token claims
-            - 'password': The Entra ID access token for database authentication
+async def _request_token_async(
+    credential: TokenCredential | AsyncTokenCredential, scope: str
+) -> str:
+    """Requests a new token for the scope, caches it and schedules its background refresh."""
+    logger.info("Acquiring Entra token for scope %s", scope)
+    # Reads of the current token while the request runs count towards the new one
+    _TOKEN_CACHE_READS.get(credential, set()).discard(scope)
+    access_token = await _acquire_token_async(credential, scope)
+    refresh_at = _get_refresh_time(access_token)
+    _TOKEN_CACHE.setdefault(credential, {})[scope] = (
+        access_token.token,
+        refresh_at,
+        access_token.expires_on,
+    )
+    _schedule_token_refresh(credential, scope, refresh_at)
+    return access_token.token
+
+
+async def _request_management_token_async(
+    credential: TokenCredential | AsyncTokenCredential,
+) -> str:
+    """Requests a management-scope token, which is only used to discover the username."""
+    logger.info("Acquiring Entra token for scope %s", AZURE_MANAGEMENT_SCOPE)
+    access_token = await _acquire_token_async(credential, AZURE_MANAGEMENT_SCOPE)
+    return access_token.token
+
+
+def _schedule_token_refresh(
+    credential: TokenCredential | AsyncTokenCredential, scope: str, refresh_at: int
+) -> None:
+    """Schedules a background refresh for when a cached token is due to be replaced.
+
+    The refresh starts once the cached token is due to be replaced, while it normally
+    stays valid for at least TOKEN_REFRESH_MARGIN more seconds. Connects made during the refresh keep
+    using the cached token instead of waiting on the request. If the token was
+    not read since it was stored, it is evicted instead of refreshed. The pending refresh
+    only holds a weak reference, so it doesn't keep a released credential alive.
+    """
+    handles = _REFRESH_HANDLES.setdefault(credential, {})
+    handle = handles.pop(scope, None)
+    if handle is not None:
+        handle.cancel()
+
+    loop = asyncio.get_running_loop()
+    credential_ref = weakref.ref(credential)
+
+    def start_refresh() -> None:
+        credential = credential_ref()
+        if credential is None:
+            return
+        _REFRESH_HANDLES.get(credential, {}).pop(scope, None)
+        if scope not in _TOKEN_CACHE_READS.get(credential, set()):
+            # Nothing used the token since it was stored, so stop refreshing it
+            _evict_cached_token(credential, scope)
+            return
+        task = loop.create_task(_refresh_token_async(credential, scope))
+        _REFRESH_TASKS.add(task)
+        task.add_done_callback(_REFRESH_TASKS.discard)
+
+    delay = max(refresh_at - time.time(), _MIN_TOKEN_REFRESH_DELAY)
+    handles[scope] = loop.call_later(delay, start_refresh)
+
+
+def _evict_cached_token(
+    credential: TokenCredential | AsyncTokenCredential, scope: str
+) -> None:
+    """Drops a cached token together with its pending refresh and the credential's username."""
+    _TOKEN_CACHE.get(credential, {}).pop(scope, None)
+    _TOKEN_CACHE_READS.get(credential, set()).discard(scope)
+    handle = _REFRESH_HANDLES.get(credential, {}).pop(scope, None)
+    if handle is not None:
+        handle.cancel()
+    _USERNAME_CACHE.pop(credential, None)
+
+
+async def _refresh_token_async(
+    credential: TokenCredential | AsyncTokenCredential, scope: str
+) -> None:
+    """Replaces a cached token in the background.
+
+    Failures are logged and otherwise ignored; the next connect fetches the token itself
+    once the cached one is due to be replaced.
+    """
+    try:
+        await _fetch_token_async(credential, scope)
+    except Exception:
+        logger.warning(
+            "Background Entra token refresh failed for scope %s", scope, exc_info=True
+        )
+
+
+def _get_username(credential: TokenCredential, db_token: str) -> str:
+    """Determines the database username for a credential from its token claims.
 
     Raises:
-        TokenDecodeError: If the JWT token cannot be decoded or is malformed.
+        TokenDecodeError: If a JWT token cannot be decoded or is malformed.
         UsernameExtractionError: If the username cannot be extracted from token claims.
-        ScopePermissionError: The token could not be acquired from the management scope, possibly due to insufficient permissions.
+        ScopePermissionError: The token could not be acquired from the management scope.
     """
-    credential = credential or DefaultAzureCredential()
-
-    # Always get the DB-scope token for password
-    db_token = get_entra_token(credential, AZURE_DB_FOR_POSTGRES_SCOPE)
-    try:
-        db_claims = decode_jwt(db_token)
-    except TokenDecodeError:
-        raise
-    xms_mirid = db_claims.get("xms_mirid")
-    username = (
-        parse_principal_name(xms_mirid)
-        if isinstance(xms_mirid, str)
-        else None
-        or db_claims.get("upn")
-        or db_claims.get("preferred_username")
-        or db_claims.get("unique_name")
-    )
+    username = _get_username_from_claims(decode_jwt_username_claims(db_token))
 
     if not username:
         # Fall back to management scope ONLY to discover username
+        logger.info("Acquiring Entra token for scope %s", AZURE_MANAGEMENT_SCOPE)
         try:
-            mgmt_token = get_entra_token(credential, AZURE_MANAGEMENT_SCOPE)
+            mgmt_token = _request_token(credential, AZURE_MANAGEMENT_SCOPE).token
         except (CredentialUnavailableError, ClientAuthenticationError) as e:
             raise ScopePermissionError(
                 "Failed to acquire token from management scope"
             ) from e
-        try:
-            mgmt_claims = decode_jwt(mgmt_token)
-        except TokenDecodeError:
-            raise
-        xms_mirid = mgmt_claims.get("xms_mirid")
-        username = (
-            parse_principal_name(xms_mirid)
-            if isinstance(xms_mirid, str)
-            else None
-            or mgmt_claims.get("upn")
-            or mgmt_claims.get("preferred_username")
-            or mgmt_claims.get("unique_name")
+        username = _get_username_from_claims(decode_jwt_username_claims(mgmt_token))
+
+    if not username:
+        raise UsernameExtractionError(
+            "Could not determine username from token claims. "
+            "Ensure the identity has the proper Azure AD attributes."
         )
 
+    return username
+
+
+async def _get_username_async(
+    credential: TokenCredential | AsyncTokenCredential, db_token: str
+) -> str:
+    """Asynchronously determines the database username for a credential from its token claims.
+
+    Raises:
+        TokenDecodeError: If a JWT token cannot be decoded or is malformed.
+        UsernameExtractionError: If the username cannot be extracted from token claims.
+        ScopePermissionError: The token could not be acquired from the management scope.
+    """
+    username = _get_username_from_claims(decode_jwt_username_claims(db_token))
+
+    if not username:
+        try:
+            mgmt_token = await _run_coalesced(
+                (credential, AZURE_MANAGEMENT_SCOPE),
+                lambda: _request_management_token_async(credential),
+            )
+        except (CredentialUnavailableError, ClientAuthenticationError) as e:
+            raise ScopePermissionError(
+                "Failed to acquire token from management scope"
+            ) from e
+        username = _get_username_from_claims(decode_jwt_username_claims(mgmt_token))
+
     if not username:
         raise UsernameExtractionError(
             "Could not determine username from token claims. "
             "Ensure the identity has the proper Azure AD attributes."
         )
 
+    return username
+
+
+def get_entra_conninfo(credential: TokenCredential | None) -> dict[str, str]:
+    """Synchronously obtains connection information from Entra authentication for Azure PostgreSQL.
+
+    This function acquires an access token from Azure Entra ID and extracts the username
+    from the token claims. It tries multiple claim sources to determine the username.
+    Tokens are cached per credential and reused until they are within
+    TOKEN_REFRESH_MARGIN seconds of expiry, or until the refresh time reported by the
+    credential; the username is resolved only once per credential.
+
+    Parameters:
+        credential (TokenCredential or None): The credential used for token acquisition.
+            If None, a shared DefaultAzureCredential() is used to automatically discover credentials.
+
+    Returns:
+        dict[str, str]: A dictionary with 'user' and 'password' keys, where:
+            - 'user': The extracted username from token claims
+            - 'password': The Entra ID access token for database authentication
+
+    Raises:
+        TokenDecodeError: If the JWT token cannot be decoded or is malformed.
+        UsernameExtractionError: If the username cannot be extracted from token claims.
+        ScopePermissionError: The token could not be acquired from the management scope, possibly due to insufficient permissions.
+    """
+    credential = credential or get_default_azure_credentials()
+
+    with _TOKEN_CACHE_LOCK:
+        # Always get the DB-scope token for password
+        db_token = _get_cached_token(credential, AZURE_DB_FOR_POSTGRES_SCOPE)
+        username = _USERNAME_CACHE.get(credential)
+        if username is None:
+            username = _get_username(credential, db_token)
+            _USERNAME_CACHE[credential] = username
+
     return {"user": username, "password": db_token}
 
 
 async def get_entra_conninfo_async(
-    credential: AsyncTokenCredential | None,
+    credential: TokenCredential | AsyncTokenCredential | None,
 ) -> dict[str, str]:
     """Asynchronously obtains connection information from Entra authentication for Azure PostgreSQL.
 
     This function acquires an access token from Azure Entra ID and extracts the username
     from the token claims. It tries multiple claim sources to determine the username.
+    Tokens are cached per credential and reused until they are within
+    TOKEN_REFRESH_MARGIN seconds of expiry, or until the refresh time reported by the
+    credential; the username is resolved only once per credential.
 
     Parameters:
-        credential (AsyncTokenCredential or None): The async credential used for token acquisition.
-            If None, AsyncDefaultAzureCredential() is used to automatically discover credentials.
+        credential (AsyncTokenCredential, TokenCredential or None): The credential used for token
+            acquisition. Sync credentials are called in a worker thread. If None, a shared
+            AsyncDefaultAzureCredential() is used to automatically discover credentials.
 
     Returns:
         dict[str, str]: A dictionary with 'user' and 'password' keys, where:
@@ -197,48 +637,52 @@ async def get_entra_conninfo_async(
         UsernameExtractionError: If the username cannot be extracted from token claims.
         ScopePermissionError: The token could not be acquired from the management scope, possibly due to insufficient permissions.
     """
-    credential = credential or AsyncDefaultAzureCredential()
+    credential = credential or get_default_azure_credentials_async()
 
-    db_token = await get_entra_token_async(credential, AZURE_DB_FOR_POSTGRES_SCOPE)
-    try:
-        db_claims = decode_jwt(db_token)
-    except TokenDecodeError:
-        raise
-    xms_mirid = db_claims.get("xms_mirid")
-    username = (
-        parse_principal_name(xms_mirid)
-        if isinstance(xms_mirid, str)
-        else None
-        or db_claims.get("upn")
-        or db_claims.get("preferred_username")
-        or db_claims.get("unique_name")
-    )
+    db_token = await _get_cached_token_async(credential, AZURE_DB_FOR_POSTGRES_SCOPE)
+    username = _USERNAME_CACHE.get(credential)
+    if username is None:
+        username = await _get_username_async(credential, db_token)
+        _USERNAME_CACHE[credential] = username
 
-    if not username:
-        try:
-            mgmt_token = await get_entra_token_async(credential, AZURE_MANAGEMENT_SCOPE)
-        except (CredentialUnavailableError, ClientAuthenticationError) as e:
-            raise ScopePermissionError(
-                "Failed to acquire token from management scope"
-            ) from e
-        try:
-            mgmt_claims = decode_jwt(mgmt_token)
-        except TokenDecodeError:
-            raise
-        xms_mirid = mgmt_claims.get("xms_mirid")
-        username = (
-            parse_principal_name(xms_mirid)
-            if isinstance(xms_mirid, str)
-            else None
-            or mgmt_claims.get("upn")
-            or mgmt_claims.get("preferred_username")
-            or mgmt_claims.get("unique_name")
-        )
+    return {"user": username, "password": db_token}
 
-    if not username:
-        raise UsernameExtractionError(
-            "Could not determine username from token claims. "
-            "Ensure the identity has the proper Azure AD attributes."
-        )
 
-    return {"user": username, "password": db_token}
+def get_entra_password(credential: TokenCredential | None) -> str:
+    """Synchronously obtains the Entra access token used as the database password.
+
+    Unlike get_entra_conninfo, the token claims are never decoded, so this is the cheaper
+    call when the database username is already known.
+
+    Parameters:
+        credential (TokenCredential or None): The credential used for token acquisition.
+            If None, a shared DefaultAzureCredential() is used to automatically discover credentials.
+
+    Returns:
+        str: The Entra ID access token for database authentication.
+    """
+    credential = credential or get_default_azure_credentials()
+
+    with _TOKEN_CACHE_LOCK:
+        return _get_cached_token(credential, AZURE_DB_FOR_POSTGRES_SCOPE)
+
+
+async def get_entra_password_async(
+    credential: TokenCredential | AsyncTokenCredential | None,
+) -> str:
+    """Asynchronously obtains the Entra access token used as the database password.
+
+    Unlike get_entra_conninfo_async, the token claims are never decoded, so this is the
+    cheaper call when the database username is already known.
+
+    Parameters:
+        credential (AsyncTokenCredential, TokenCredential or None): The credential used for token
+            acquisition. Sync credentials are called in a worker thread. If None, a shared
+            AsyncDefaultAzureCredential() is used to automatically discover credentials.
+
+    Returns:
+        str: The Entra ID access token for database authentication.
+    """
+    credential = credential or get_default_azure_credentials_async()
+
+    return await _get_cached_token_async(credential, AZURE_DB_FOR_POSTGRES_SCOPE)
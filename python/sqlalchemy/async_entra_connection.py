@@ -3,11 +3,13 @@
 from typing import Any
 
 from azure.core.credentials import TokenCredential
+from azure.core.credentials_async import AsyncTokenCredential
 
 try:
     from sqlalchemy import event
     from sqlalchemy.engine import Dialect
     from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.util import await_only
 except ImportError as e:
     # Provide a helpful error message if SQLAlchemy dependencies are missing
     raise ImportError(
@@ -15,7 +17,7 @@ except ImportError as e:
         "Install them with: pip install azurepg-entra[sqlalchemy]"
     ) from e
 
-from shared import get_entra_conninfo
+from shared import get_entra_conninfo_async, get_entra_password_async
 from errors import (
     CredentialValueError,
     EntraConnectionValueError,
@@ -28,8 +30,9 @@ def enable_entra_authentication_async(engine: AsyncEngine) -> None:
 
     This function registers an event listener that automatically provides
     Entra ID credentials for each database connection if they are not already set.
-    Event handlers do not support async behavior so the token fetching will still
-    be synchronous.
+    Event handlers are synchronous, but for async engines they run inside SQLAlchemy's
+    greenlet bridge, so the token is fetched with await_only and the event loop is not
+    blocked. Sync credentials are called in a worker thread.
 
     Args:
         engine: The async SQLAlchemy Engine to enable Entra authentication for
@@ -42,28 +45,31 @@ def enable_entra_authentication_async(engine: AsyncEngine) -> None:
         """Event handler that provides Entra credentials for each sync connection.
 
         Raises:
-            CredentialValueError: If the provided credential is not a valid TokenCredential.
+            CredentialValueError: If the provided credential is not a valid AsyncTokenCredential or TokenCredential.
             EntraConnectionValueError: If Entra connection credentials cannot be retrieved
         """
         credential = cparams.get("credential", None)
-        if credential and not isinstance(credential, (TokenCredential)):
+        if credential and not isinstance(
+            credential, (AsyncTokenCredential, TokenCredential)
+        ):
             raise CredentialValueError(
-                "credential must be a TokenCredential for async connections"
+                "credential must be an AsyncTokenCredential or TokenCredential for async connections"
             )
         # Check if credentials are already present
         has_user = "user" in cparams
         has_password = "password" in cparams
 
-        # Only get Entra credentials if user or password is missing
-        if not has_user or not has_password:
-            try:
-                entra_creds = get_entra_conninfo(credential)
-            except Exception as e:
-                raise EntraConnectionValueError(
-                    "Could not retrieve Entra credentials"
-                ) from e
-            # Only update missing credentials
-            if not has_user and "user" in entra_creds:
+        # Only get Entra credentials if user or password is missing. The token only
+        # has to be decoded when the username must be discovered from its claims.
+        try:
+            if not has_user:
+                entra_creds = await_only(get_entra_conninfo_async(credential))
                 cparams["user"] = entra_creds["user"]
-            if not has_password and "password" in entra_creds:
-                cparams["password"] = entra_creds["password"]
+                if not has_password:
+                    cparams["password"] = entra_creds["password"]
+            elif not has_password:
+                cparams["password"] = await_only(get_entra_password_async(credential))
+        except Exception as e:
+            raise EntraConnectionValueError(
+                "Could not retrieve Entra credentials"
+            ) from e
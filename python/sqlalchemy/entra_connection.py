@@ -13,7 +13,7 @@ except ImportError as e:
         "Install them with: pip install azurepg-entra[sqlalchemy]"
     ) from e
 
-from shared import get_entra_conninfo
+from shared import get_entra_conninfo, get_entra_password
 from errors import (
     CredentialValueError,
     EntraConnectionValueError,
@@ -50,16 +50,17 @@ def enable_entra_authentication(engine: Engine) -> None:
         has_user = "user" in cparams
         has_password = "password" in cparams
 
-        # Only get Entra credentials if user or password is missing
-        if not has_user or not has_password:
-            try:
+        # Only get Entra credentials if user or password is missing. The token only
+        # has to be decoded when the username must be discovered from its claims.
+        try:
+            if not has_user:
                 entra_creds = get_entra_conninfo(credential)
-            except Exception as e:
-                raise EntraConnectionValueError(
-                    "Could not retrieve Entra credentials"
-                ) from e
-            # Only update missing credentials
-            if not has_user and "user" in entra_creds:
                 cparams["user"] = entra_creds["user"]
-            if not has_password and "password" in entra_creds:
-                cparams["password"] = entra_creds["password"]
+                if not has_password:
+                    cparams["password"] = entra_creds["password"]
+            elif not has_password:
+                cparams["password"] = get_entra_password(credential)
+        except Exception as e:
+            raise EntraConnectionValueError(
+                "Could not retrieve Entra credentials"
+            ) from e